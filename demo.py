@@ -4,7 +4,7 @@ Demo script showing the insurance claims agent with mock data.
 This demonstrates the complete workflow without requiring API keys.
 """
 
-import json
+from collections import Counter
 from datetime import datetime
 from uuid import uuid4
 
@@ -159,12 +159,8 @@ def create_demo_claims():
     ]
 
 
-def process_demo_claim(name, claim_data, validator, router):
+def process_demo_claim(name, claim_data, validator, router, output_file):
     """Process a single demo claim"""
-    print(f"\n{'='*70}")
-    print(f"Processing: {name}")
-    print(f"{'='*70}\n")
-    
     # Validate
     missing_fields = validator.validate_claim(claim_data)
     
@@ -181,25 +177,26 @@ def process_demo_claim(name, claim_data, validator, router):
         reasoning=reasoning
     )
     
-    # Display summary
-    print(f"Claim ID: {output.claim_id}")
-    print(f"Policy: {claim_data.policy_information.policy_number or 'N/A'}")
-    print(f"Policyholder: {claim_data.policy_information.policyholder_name or 'N/A'}")
-    print(f"Estimated Damage: ${claim_data.asset_details.estimated_damage or 0:,.2f}")
-    print(f"\nMissing Fields: {len(missing_fields)}")
-    if missing_fields:
-        for field in missing_fields:
-            print(f"  - {field}")
-    
-    print(f"\n🎯 Recommended Route: {route}")
-    print(f"\n💡 Reasoning: {reasoning}")
-    
     # Save output
-    output_file = f"data/output/demo_{name.lower().replace(' ', '_')}_output.json"
-    with open(output_file, 'w') as f:
-        json.dump(output.model_dump(), f, indent=2)
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.write(output.model_dump_json(indent=2))
     
-    print(f"\n✓ Output saved to: {output_file}")
+    # Display summary, buffered into a single print
+    lines = [
+        f"\n{'='*70}",
+        f"Processing: {name}",
+        f"{'='*70}\n",
+        f"Claim ID: {output.claim_id}",
+        f"Policy: {claim_data.policy_information.policy_number or 'N/A'}",
+        f"Policyholder: {claim_data.policy_information.policyholder_name or 'N/A'}",
+        f"Estimated Damage: ${claim_data.asset_details.estimated_damage or 0:,.2f}",
+        f"\nMissing Fields: {len(missing_fields)}",
+    ]
+    lines.extend(f"  - {field}" for field in missing_fields)
+    lines.append(f"\n🎯 Recommended Route: {route}")
+    lines.append(f"\n💡 Reasoning: {reasoning}")
+    lines.append(f"\n✓ Output saved to: {output_file}")
+    print("\n".join(lines))
     
     return output
 
@@ -223,28 +220,31 @@ def main():
     
     # Create and process demo claims
     demo_claims = create_demo_claims()
-    results = []
+    output_files = [
+        f"data/output/demo_{name.lower().replace(' ', '_')}_output.json"
+        for name, _ in demo_claims
+    ]
+    results = [None] * len(demo_claims)
     
-    for name, claim_data in demo_claims:
-        output = process_demo_claim(name, claim_data, validator, router)
-        results.append((name, output))
+    for i, ((name, claim_data), output_file) in enumerate(zip(demo_claims, output_files)):
+        output = process_demo_claim(name, claim_data, validator, router, output_file)
+        results[i] = (name, output)
     
     # Summary
     print(f"\n\n{'='*70}")
     print("PROCESSING SUMMARY")
     print(f"{'='*70}\n")
     
-    route_counts = {}
     for name, output in results:
-        route = output.recommended_route
-        route_counts[route] = route_counts.get(route, 0) + 1
-        print(f"✓ {name}: {route}")
+        print(f"✓ {name}: {output.recommended_route}")
+    
+    route_counts = Counter(output.recommended_route for _, output in results)
     
     print(f"\n{'='*70}")
     print("ROUTING DISTRIBUTION")
     print(f"{'='*70}\n")
     
-    for route, count in sorted(route_counts.items()):
+    for route, count in route_counts.most_common():
         print(f"{route}: {count} claim(s)")
     
     print(f"\n{'='*70}")
@@ -5,13 +5,23 @@ Manages environment variables, API keys, and routing rules.
 """
 
 import os
-from typing import List, Set
+import re
+from typing import FrozenSet, Iterable, List, Pattern
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
 
+def _keyword_pattern(keywords: Iterable[str]) -> Pattern[str]:
+    """Compile keywords into one case-insensitive alternation (longest first)"""
+    alternation = "|".join(
+        re.escape(keyword) for keyword in sorted(keywords, key=lambda k: (-len(k), k))
+    )
+    # An empty keyword set must match nothing rather than the empty string
+    return re.compile(f"(?:{alternation})" if alternation else r"(?!)", re.IGNORECASE)
+
+
 class Config:
     """Application configuration"""
     
@@ -22,7 +32,7 @@ class Config:
     FAST_TRACK_THRESHOLD: float = float(os.getenv("FAST_TRACK_THRESHOLD", "25000"))
     
     # Mandatory Fields
-    MANDATORY_FIELDS: Set[str] = {
+    MANDATORY_FIELDS: FrozenSet[str] = frozenset({
         "policy_number",
         "policyholder_name",
         "date_of_loss",
@@ -30,10 +40,10 @@ class Config:
         "claim_type",
         "estimated_damage",
         "claimant"
-    }
+    })
     
     # Fraud Detection Keywords
-    FRAUD_KEYWORDS: Set[str] = {
+    FRAUD_KEYWORDS: FrozenSet[str] = frozenset({
         "fraud",
         "fraudulent",
         "inconsistent",
@@ -44,10 +54,10 @@ class Config:
         "deceptive",
         "misleading",
         "contradictory"
-    }
+    })
     
     # Injury-related Keywords
-    INJURY_KEYWORDS: Set[str] = {
+    INJURY_KEYWORDS: FrozenSet[str] = frozenset({
         "injury",
         "injured",
         "bodily injury",
@@ -57,7 +67,11 @@ class Config:
         "ambulance",
         "emergency",
         "paramedic"
-    }
+    })
+    
+    # Single-pass keyword scanners built from the sets above
+    FRAUD_RE: Pattern[str] = _keyword_pattern(FRAUD_KEYWORDS)
+    INJURY_RE: Pattern[str] = _keyword_pattern(INJURY_KEYWORDS)
     
     # Logging
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
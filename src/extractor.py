@@ -4,22 +4,74 @@ PDF extraction module for ACORD FNOL documents.
 Extracts structured data from insurance claim PDFs using AI-powered parsing.
 """
 
+import asyncio
+import io
 import pdfplumber
-import json
 import re
-from typing import Dict, Any, Optional
+import threading
+from typing import Dict, Any, List, Optional
 from pathlib import Path
 
-from .models import (
-    ClaimData, PolicyInformation, IncidentInformation,
-    InvolvedParties, AssetDetails, ContactDetails
-)
+try:
+    import pypdfium2 as pdfium
+except ImportError:  # pypdfium2 is optional; pdfplumber handles every PDF
+    pdfium = None
+
+from .models import ClaimData, ExtractedFields
 from .config import Config, ACORD_FIELD_MAPPING
 
 
+# Regex patterns for the fallback extractor, compiled once at import
+_POLICY_RE = re.compile(r'POLICY NUMBER[:\s]+([A-Z0-9-]+)', re.IGNORECASE)
+_DATE_RE = re.compile(r'DATE OF LOSS[:\s]+(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})', re.IGNORECASE)
+_VIN_RE = re.compile(r'V\.I\.N\.[:\s]+([A-HJ-NPR-Z0-9]{17})', re.IGNORECASE)
+_ESTIMATE_RE = re.compile(r'ESTIMATE AMOUNT[:\s]*\$?\s*([0-9,]+(?:\.\d{2})?)', re.IGNORECASE)
+
+# Fewer words than this from the PDFium text layer means the fast path
+# failed (e.g. a scanned form) and pdfplumber should be tried instead
+_MIN_FAST_PATH_WORDS = 50
+
+# Fields extract_with_regex can supply
+_REGEX_FIELDS = ('policy_number', 'date_of_loss', 'vin', 'estimated_damage')
+
+
+def _strict_json_schema(model) -> Dict[str, Any]:
+    """
+    Build a JSON schema for OpenAI strict structured outputs from a flat model.
+    
+    Strict mode requires every property to be listed as required (nullable
+    fields stay optional through their null type) and rejects extra keys.
+    """
+    schema = model.model_json_schema()
+    for field_schema in schema["properties"].values():
+        field_schema.pop("default", None)
+    schema["required"] = list(schema["properties"])
+    schema["additionalProperties"] = False
+    return schema
+
+
+# Structured-output request payload for AI extraction. Generating the
+# schema walks the whole model definition, so the payload is built once at
+# import and reused by every request.
+_EXTRACTION_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "claim_extraction",
+        "schema": _strict_json_schema(ExtractedFields),
+        "strict": True
+    }
+}
+
+
 class PDFExtractor:
     """Extracts claim data from PDF documents"""
     
+    # OpenAI client shared by all extractors so batch runs reuse one
+    # HTTP connection pool instead of reconnecting per instance
+    _client_singleton = None
+    _async_client_singleton = None
+    _client_lock = threading.Lock()
+    
     def __init__(self, use_ai: bool = True):
         """
         Initialize the PDF extractor.
@@ -30,8 +82,27 @@ class PDFExtractor:
         self.use_ai = use_ai and Config.validate()
         
         if self.use_ai:
-            from openai import OpenAI
-            self.client = OpenAI(api_key=Config.OPENAI_API_KEY)
+            self.client = self._get_client()
+    
+    @classmethod
+    def _get_client(cls):
+        """Return the shared OpenAI client, creating it on first use"""
+        if cls._client_singleton is None:
+            with cls._client_lock:
+                if cls._client_singleton is None:
+                    from openai import OpenAI
+                    cls._client_singleton = OpenAI(api_key=Config.OPENAI_API_KEY)
+        return cls._client_singleton
+    
+    @classmethod
+    def _get_async_client(cls):
+        """Return the shared async OpenAI client, creating it on first use"""
+        if cls._async_client_singleton is None:
+            with cls._client_lock:
+                if cls._async_client_singleton is None:
+                    from openai import AsyncOpenAI
+                    cls._async_client_singleton = AsyncOpenAI(api_key=Config.OPENAI_API_KEY)
+        return cls._async_client_singleton
     
     def extract_text_from_pdf(self, pdf_path: str) -> str:
         """
@@ -43,24 +114,56 @@ class PDFExtractor:
         Returns:
             Extracted text content
         """
+        # Read the file once and hand the same bytes to each text extractor
         try:
-            with pdfplumber.open(pdf_path) as pdf:
-                text = ""
-                for page in pdf.pages:
-                    text += page.extract_text() or ""
-                return text
+            with open(pdf_path, 'rb') as f:
+                data = f.read()
+        except Exception as e:
+            raise Exception(f"Error reading PDF: {str(e)}")
+        
+        if pdfium is not None:
+            try:
+                text = self._extract_text_fast(data)
+                if len(text.split()) >= _MIN_FAST_PATH_WORDS:
+                    return text
+            except Exception:
+                pass  # fall back to pdfplumber below
+        
+        try:
+            with pdfplumber.open(io.BytesIO(data)) as pdf:
+                return "".join(page.extract_text() or "" for page in pdf.pages)
         except Exception as e:
             raise Exception(f"Error reading PDF: {str(e)}")
     
-    def extract_with_ai(self, text: str) -> Dict[str, Any]:
+    def _extract_text_fast(self, data: bytes) -> str:
         """
-        Use OpenAI GPT-4 to extract structured data from text.
+        Extract raw text with PDFium, skipping pdfplumber's layout analysis.
+        
+        ACORD FNOL forms are mostly linear text, so the plain text layer is
+        enough and several times faster to read.
+        
+        Args:
+            data: Raw bytes of the PDF file
+            
+        Returns:
+            Extracted text content
+        """
+        pdf = pdfium.PdfDocument(data)
+        try:
+            # Pages are joined like the pdfplumber path, so both give the same text
+            return "".join(page.get_textpage().get_text_range() for page in pdf)
+        finally:
+            pdf.close()
+    
+    def _build_messages(self, text: str) -> List[Dict[str, str]]:
+        """
+        Build the chat messages for AI extraction.
         
         Args:
             text: Raw text from PDF
             
         Returns:
-            Dictionary of extracted fields
+            List of chat messages for the completions API
         """
         prompt = f"""
 You are an insurance claims processing assistant. Extract the following information from this ACORD FNOL (First Notice of Loss) document.
@@ -95,28 +198,70 @@ Document text:
 Return ONLY the JSON object, nothing else.
 """
         
+        return [
+            {"role": "system", "content": "You are a data extraction assistant. Return only valid JSON."},
+            {"role": "user", "content": prompt}
+        ]
+    
+    @staticmethod
+    def _parse_ai_response(response) -> Dict[str, Any]:
+        """
+        Validate the structured output of a completions response.
+        
+        Args:
+            response: Chat completions response
+            
+        Returns:
+            Dictionary of extracted fields
+        """
+        content = response.choices[0].message.content
+        
+        # The LLM output is untrusted, so its field types are checked here,
+        # before it is merged with the regex results. Nulls are dropped so
+        # absent fields keep their defaults.
+        return ExtractedFields.model_validate_json(content).model_dump(exclude_none=True)
+    
+    def extract_with_ai(self, text: str) -> Dict[str, Any]:
+        """
+        Use OpenAI GPT-4 to extract structured data from text.
+        
+        Args:
+            text: Raw text from PDF
+            
+        Returns:
+            Dictionary of extracted fields
+        """
         try:
             response = self.client.chat.completions.create(
                 model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": "You are a data extraction assistant. Return only valid JSON."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0
+                messages=self._build_messages(text),
+                temperature=0,
+                response_format=_EXTRACTION_RESPONSE_FORMAT
             )
-            content = response.choices[0].message.content
+            return self._parse_ai_response(response)
             
-            # Clean up the response (remove markdown code blocks if present)
-            content = content.strip()
-            if content.startswith("```json"):
-                content = content[7:]
-            if content.startswith("```"):
-                content = content[3:]
-            if content.endswith("```"):
-                content = content[:-3]
-            content = content.strip()
+        except Exception as e:
+            print(f"OpenAI API extraction error: {str(e)}")
+            return {}
+    
+    async def extract_with_ai_async(self, text: str) -> Dict[str, Any]:
+        """
+        Async variant of extract_with_ai, so batch requests can run concurrently.
+        
+        Args:
+            text: Raw text from PDF
             
-            return json.loads(content)
+        Returns:
+            Dictionary of extracted fields
+        """
+        try:
+            response = await self._get_async_client().chat.completions.create(
+                model="gpt-4o-mini",
+                messages=self._build_messages(text),
+                temperature=0,
+                response_format=_EXTRACTION_RESPONSE_FORMAT
+            )
+            return self._parse_ai_response(response)
             
         except Exception as e:
             print(f"OpenAI API extraction error: {str(e)}")
@@ -135,22 +280,22 @@ Return ONLY the JSON object, nothing else.
         extracted = {}
         
         # Policy number pattern
-        policy_match = re.search(r'POLICY NUMBER[:\s]+([A-Z0-9-]+)', text, re.IGNORECASE)
+        policy_match = _POLICY_RE.search(text)
         if policy_match:
             extracted['policy_number'] = policy_match.group(1).strip()
         
         # Date of loss pattern
-        date_match = re.search(r'DATE OF LOSS[:\s]+(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})', text, re.IGNORECASE)
+        date_match = _DATE_RE.search(text)
         if date_match:
             extracted['date_of_loss'] = date_match.group(1).strip()
         
         # VIN pattern
-        vin_match = re.search(r'V\.I\.N\.[:\s]+([A-HJ-NPR-Z0-9]{17})', text, re.IGNORECASE)
+        vin_match = _VIN_RE.search(text)
         if vin_match:
             extracted['vin'] = vin_match.group(1).strip()
         
         # Estimate amount pattern
-        estimate_match = re.search(r'ESTIMATE AMOUNT[:\s]*\$?\s*([0-9,]+(?:\.\d{2})?)', text, re.IGNORECASE)
+        estimate_match = _ESTIMATE_RE.search(text)
         if estimate_match:
             amount_str = estimate_match.group(1).replace(',', '')
             try:
@@ -179,55 +324,80 @@ Return ONLY the JSON object, nothing else.
         else:
             extracted = self.extract_with_regex(text)
         
-        # If AI didn't get everything, supplement with regex
-        if self.use_ai:
-            regex_data = self.extract_with_regex(text)
-            for key, value in regex_data.items():
-                if key not in extracted or not extracted[key]:
-                    extracted[key] = value
-        
-        # Build structured data models
-        policy_info = PolicyInformation(
-            policy_number=extracted.get('policy_number'),
-            policyholder_name=extracted.get('policyholder_name'),
-            effective_dates=extracted.get('effective_dates')
-        )
-        
-        incident_info = IncidentInformation(
-            date_of_loss=extracted.get('date_of_loss'),
-            time_of_loss=extracted.get('time_of_loss'),
-            location=extracted.get('location'),
-            description=extracted.get('description'),
-            police_report_number=extracted.get('police_report_number')
-        )
+        return self._build_claim_data(text, extracted)
+    
+    async def extract_from_pdf_async(self, pdf_path: str) -> ClaimData:
+        """
+        Async variant of extract_from_pdf for concurrent batch processing.
         
-        contact_details = ContactDetails(
-            phone=extracted.get('phone'),
-            email=extracted.get('email')
+        Args:
+            pdf_path: Path to the PDF file
+            
+        Returns:
+            ClaimData object with extracted information
+        """
+        # PDF parsing is blocking, so keep it off the event loop
+        text = await asyncio.get_running_loop().run_in_executor(
+            None, self.extract_text_from_pdf, pdf_path
         )
         
-        involved_parties = InvolvedParties(
-            claimant=extracted.get('claimant'),
-            contact_details=contact_details
-        )
+        if self.use_ai:
+            extracted = await self.extract_with_ai_async(text)
+        else:
+            extracted = self.extract_with_regex(text)
         
-        asset_details = AssetDetails(
-            asset_type=extracted.get('asset_type', 'Vehicle'),
-            asset_id=extracted.get('vin'),
-            estimated_damage=extracted.get('estimated_damage'),
-            make=extracted.get('make'),
-            model=extracted.get('model'),
-            year=extracted.get('year'),
-            damage_description=extracted.get('damage_description')
-        )
+        return self._build_claim_data(text, extracted)
+    
+    def _build_claim_data(self, text: str, extracted: Dict[str, Any]) -> ClaimData:
+        """
+        Assemble extracted fields into a ClaimData object.
         
-        claim_data = ClaimData(
-            policy_information=policy_info,
-            incident_information=incident_info,
-            involved_parties=involved_parties,
-            asset_details=asset_details,
-            claim_type=extracted.get('claim_type'),
-            initial_estimate=extracted.get('estimated_damage')
-        )
+        Args:
+            text: Raw text from PDF
+            extracted: Dictionary of extracted fields
+            
+        Returns:
+            ClaimData object with extracted information
+        """
+        # If AI didn't get everything the regex patterns can supply,
+        # supplement with regex (skipped when those fields are all present)
+        if self.use_ai and not all(extracted.get(field) for field in _REGEX_FIELDS):
+            regex_data = self.extract_with_regex(text)
+            for key, value in regex_data.items():
+                if key not in extracted or not extracted[key]:
+                    extracted[key] = value
         
-        return claim_data
+        # Build structured data models in one validation pass over the nested
+        # dict; pydantic-core does this faster than model_construct
+        return ClaimData.model_validate({
+            'policy_information': {
+                'policy_number': extracted.get('policy_number'),
+                'policyholder_name': extracted.get('policyholder_name'),
+                'effective_dates': extracted.get('effective_dates')
+            },
+            'incident_information': {
+                'date_of_loss': extracted.get('date_of_loss'),
+                'time_of_loss': extracted.get('time_of_loss'),
+                'location': extracted.get('location'),
+                'description': extracted.get('description'),
+                'police_report_number': extracted.get('police_report_number')
+            },
+            'involved_parties': {
+                'claimant': extracted.get('claimant'),
+                'contact_details': {
+                    'phone': extracted.get('phone'),
+                    'email': extracted.get('email')
+                }
+            },
+            'asset_details': {
+                'asset_type': extracted.get('asset_type', 'Vehicle'),
+                'asset_id': extracted.get('vin'),
+                'estimated_damage': extracted.get('estimated_damage'),
+                'make': extracted.get('make'),
+                'model': extracted.get('model'),
+                'year': extracted.get('year'),
+                'damage_description': extracted.get('damage_description')
+            },
+            'claim_type': extracted.get('claim_type'),
+            'initial_estimate': extracted.get('estimated_damage')
+        })
@@ -5,16 +5,18 @@ Orchestrates the complete claim processing workflow.
 """
 
 import argparse
-import json
+import asyncio
+import os
 import uuid
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Callable, List, Optional, Tuple
 
 from .extractor import PDFExtractor
 from .validator import ClaimValidator
 from .router import ClaimRouter
-from .models import ClaimOutput
+from .models import ClaimData, ClaimOutput
 from .config import Config
 
 
@@ -32,43 +34,98 @@ class ClaimsAgent:
         self.validator = ClaimValidator()
         self.router = ClaimRouter()
     
-    def process_claim(self, pdf_path: str, output_path: Optional[str] = None) -> ClaimOutput:
+    def process_claim(
+        self,
+        pdf_path: str,
+        output_path: Optional[str] = None,
+        log: Callable[[str], None] = print
+    ) -> ClaimOutput:
         """
         Process a single claim from PDF to routed output.
         
         Args:
             pdf_path: Path to the FNOL PDF file
             output_path: Optional path to save JSON output
+            log: Receives each progress message; batch runs collect them so
+                each claim's output is printed as one block
             
         Returns:
             ClaimOutput object with complete processing results
         """
-        print(f"\n{'='*60}")
-        print(f"Processing claim: {Path(pdf_path).name}")
-        print(f"{'='*60}\n")
+        log(f"\n{'='*60}")
+        log(f"Processing claim: {Path(pdf_path).name}")
+        log(f"{'='*60}\n")
         
         # Step 1: Extract data from PDF
-        print("Step 1: Extracting data from PDF...")
+        log("Step 1: Extracting data from PDF...")
         claim_data = self.extractor.extract_from_pdf(pdf_path)
-        print("✓ Extraction complete")
+        log("✓ Extraction complete")
         
+        return self._complete_claim(claim_data, output_path, log)
+    
+    async def process_claim_async(
+        self,
+        pdf_path: str,
+        output_path: Optional[str] = None,
+        log: Callable[[str], None] = print
+    ) -> ClaimOutput:
+        """
+        Async variant of process_claim; extraction requests run concurrently.
+        
+        Args:
+            pdf_path: Path to the FNOL PDF file
+            output_path: Optional path to save JSON output
+            log: Receives each progress message; batch runs collect them so
+                each claim's output is printed as one block
+            
+        Returns:
+            ClaimOutput object with complete processing results
+        """
+        log(f"\n{'='*60}")
+        log(f"Processing claim: {Path(pdf_path).name}")
+        log(f"{'='*60}\n")
+        
+        # Step 1: Extract data from PDF
+        log("Step 1: Extracting data from PDF...")
+        claim_data = await self.extractor.extract_from_pdf_async(pdf_path)
+        log("✓ Extraction complete")
+        
+        return self._complete_claim(claim_data, output_path, log)
+    
+    def _complete_claim(
+        self,
+        claim_data: ClaimData,
+        output_path: Optional[str],
+        log: Callable[[str], None]
+    ) -> ClaimOutput:
+        """
+        Validate, route and save an extracted claim.
+        
+        Args:
+            claim_data: The extracted claim data
+            output_path: Optional path to save JSON output
+            log: Receives each progress message
+            
+        Returns:
+            ClaimOutput object with complete processing results
+        """
         # Step 2: Validate extracted data
-        print("\nStep 2: Validating extracted fields...")
-        validation_result = self.validator.get_validation_summary(claim_data)
-        missing_fields = validation_result['missing_fields']
+        log("\nStep 2: Validating extracted fields...")
+        missing_fields = self.validator.validate_claim(claim_data)
+        warnings = self.validator.check_data_consistency(claim_data)
         
         if missing_fields:
-            print(f"⚠ Found {len(missing_fields)} missing field(s): {', '.join(missing_fields)}")
+            log(f"⚠ Found {len(missing_fields)} missing field(s): {', '.join(missing_fields)}")
         else:
-            print("✓ All mandatory fields present")
+            log("✓ All mandatory fields present")
         
-        if validation_result['warnings']:
-            print(f"⚠ Warnings: {'; '.join(validation_result['warnings'])}")
+        if warnings:
+            log(f"⚠ Warnings: {'; '.join(warnings)}")
         
         # Step 3: Route the claim
-        print("\nStep 3: Routing claim...")
+        log("\nStep 3: Routing claim...")
         route, reasoning = self.router.route_claim(claim_data, missing_fields)
-        print(f"✓ Route determined: {route}")
+        log(f"✓ Route determined: {route}")
         
         # Create output
         claim_output = ClaimOutput(
@@ -83,10 +140,10 @@ class ClaimsAgent:
         # Save to file if output path provided
         if output_path:
             self.save_output(claim_output, output_path)
-            print(f"\n✓ Output saved to: {output_path}")
+            log(f"\n✓ Output saved to: {output_path}")
         
         # Print summary
-        self.print_summary(claim_output)
+        log(self.format_summary(claim_output))
         
         return claim_output
     
@@ -98,10 +155,8 @@ class ClaimsAgent:
             claim_output: The claim output object
             output_path: Path to save the JSON file
         """
-        output_dict = claim_output.model_dump()
-        
-        with open(output_path, 'w') as f:
-            json.dump(output_dict, f, indent=2)
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write(claim_output.model_dump_json(indent=2))
     
     def print_summary(self, claim_output: ClaimOutput):
         """
@@ -110,20 +165,91 @@ class ClaimsAgent:
         Args:
             claim_output: The claim output object
         """
-        print(f"\n{'='*60}")
-        print("CLAIM PROCESSING SUMMARY")
-        print(f"{'='*60}")
-        print(f"Claim ID: {claim_output.claim_id}")
-        print(f"Processed At: {claim_output.processed_at}")
-        print(f"\nRecommended Route: {claim_output.recommended_route}")
-        print(f"\nReasoning: {claim_output.reasoning}")
+        print(self.format_summary(claim_output))
+    
+    def format_summary(self, claim_output: ClaimOutput) -> str:
+        """
+        Format the claim processing summary as one block of text.
+        
+        Args:
+            claim_output: The claim output object
+            
+        Returns:
+            Summary text, ready to print with a single write
+        """
+        lines = [
+            f"\n{'='*60}",
+            "CLAIM PROCESSING SUMMARY",
+            f"{'='*60}",
+            f"Claim ID: {claim_output.claim_id}",
+            f"Processed At: {claim_output.processed_at}",
+            f"\nRecommended Route: {claim_output.recommended_route}",
+            f"\nReasoning: {claim_output.reasoning}",
+        ]
         
         if claim_output.missing_fields:
-            print(f"\nMissing Fields ({len(claim_output.missing_fields)}):")
-            for field in claim_output.missing_fields:
-                print(f"  - {field}")
+            lines.append(f"\nMissing Fields ({len(claim_output.missing_fields)}):")
+            lines.extend(f"  - {field}" for field in claim_output.missing_fields)
         
-        print(f"\n{'='*60}\n")
+        lines.append(f"\n{'='*60}\n")
+        return "\n".join(lines)
+
+
+# Per-process agent used by the batch process pool
+_worker_agent: Optional[ClaimsAgent] = None
+
+
+def _init_worker():
+    """Create the regex-only claims agent once for each worker process"""
+    global _worker_agent
+    _worker_agent = ClaimsAgent(use_ai=False)
+
+
+def _process_in_worker(pdf_path: str, output_path: str) -> str:
+    """Process a claim with the worker process's agent and return its progress output"""
+    lines: List[str] = []
+    try:
+        _worker_agent.process_claim(pdf_path, output_path, log=lines.append)
+    except Exception as e:
+        lines.append(f"Error processing {Path(pdf_path).name}: {str(e)}\n")
+    return "\n".join(lines)
+
+
+def _process_batch_in_pool(jobs: List[Tuple[Path, Path]], max_workers: int):
+    """Process (pdf, output) pairs in worker processes, one output block per claim"""
+    executor = ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker)
+    with executor:
+        futures = {
+            executor.submit(_process_in_worker, str(pdf_file), str(output_path)): pdf_file
+            for pdf_file, output_path in jobs
+        }
+        for future in as_completed(futures):
+            try:
+                print(future.result())
+            except Exception as e:
+                print(f"Error processing {futures[future].name}: {str(e)}\n")
+
+
+async def _process_batch_async(
+    agent: ClaimsAgent,
+    jobs: List[Tuple[Path, Path]],
+    max_concurrency: int
+):
+    """Process (pdf, output) pairs concurrently, capping in-flight claims"""
+    semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async def run(pdf_file: Path, output_path: Path):
+        # Claims interleave while awaiting the API, so each one's progress
+        # is collected and printed as a block once it finishes
+        lines: List[str] = []
+        async with semaphore:
+            try:
+                await agent.process_claim_async(str(pdf_file), str(output_path), log=lines.append)
+            except Exception as e:
+                lines.append(f"Error processing {pdf_file.name}: {str(e)}\n")
+        print("\n".join(lines))
+    
+    await asyncio.gather(*(run(pdf_file, output_path) for pdf_file, output_path in jobs))
 
 
 def main():
@@ -152,12 +278,21 @@ def main():
         action='store_true',
         help='Disable AI extraction (use regex only)'
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Number of claims to process in parallel with --input-dir '
+             '(default: 32 with AI, CPU count without)'
+    )
     
     args = parser.parse_args()
     
     # Validate arguments
     if not args.input and not args.input_dir:
         parser.error("Either --input or --input-dir must be provided")
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
     
     # Create output directory if it doesn't exist
     output_dir = Path(args.output_dir)
@@ -192,12 +327,16 @@ def main():
         
         print(f"Found {len(pdf_files)} PDF file(s) to process\n")
         
-        for pdf_file in pdf_files:
-            output_path = output_dir / f"{pdf_file.stem}_output.json"
-            try:
-                agent.process_claim(str(pdf_file), str(output_path))
-            except Exception as e:
-                print(f"Error processing {pdf_file.name}: {str(e)}\n")
+        jobs = [(pdf_file, output_dir / f"{pdf_file.stem}_output.json") for pdf_file in pdf_files]
+        
+        # Claims are independent: AI extraction is network-bound, so the
+        # requests are issued concurrently from one event loop; regex
+        # extraction is CPU-bound in pdfplumber, so it runs in worker
+        # processes with their own agent
+        if agent.extractor.use_ai:
+            asyncio.run(_process_batch_async(agent, jobs, args.workers or 32))
+        else:
+            _process_batch_in_pool(jobs, args.workers or os.cpu_count())
 
 
 if __name__ == "__main__":
@@ -6,7 +6,7 @@ Defines Pydantic models for structured claim data.
 
 from datetime import datetime
 from typing import Optional, List
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from enum import Enum
 
 
@@ -29,6 +29,8 @@ class RouteType(str, Enum):
 
 class PolicyInformation(BaseModel):
     """Policy-related information"""
+    model_config = ConfigDict(frozen=True, extra='ignore')
+    
     policy_number: Optional[str] = None
     policyholder_name: Optional[str] = None
     effective_dates: Optional[str] = None
@@ -38,6 +40,8 @@ class PolicyInformation(BaseModel):
 
 class IncidentInformation(BaseModel):
     """Incident details"""
+    model_config = ConfigDict(frozen=True, extra='ignore')
+    
     date_of_loss: Optional[str] = None
     time_of_loss: Optional[str] = None
     location: Optional[str] = None
@@ -47,6 +51,8 @@ class IncidentInformation(BaseModel):
 
 class ContactDetails(BaseModel):
     """Contact information"""
+    model_config = ConfigDict(frozen=True, extra='ignore')
+    
     phone: Optional[str] = None
     email: Optional[str] = None
     address: Optional[str] = None
@@ -54,6 +60,8 @@ class ContactDetails(BaseModel):
 
 class InvolvedParties(BaseModel):
     """Information about parties involved in the claim"""
+    model_config = ConfigDict(frozen=True, extra='ignore')
+    
     claimant: Optional[str] = None
     third_parties: List[str] = Field(default_factory=list)
     contact_details: Optional[ContactDetails] = None
@@ -63,6 +71,8 @@ class InvolvedParties(BaseModel):
 
 class AssetDetails(BaseModel):
     """Details about damaged assets"""
+    model_config = ConfigDict(frozen=True, extra='ignore')
+    
     asset_type: Optional[str] = None
     asset_id: Optional[str] = None  # VIN for vehicles
     estimated_damage: Optional[float] = None
@@ -74,6 +84,8 @@ class AssetDetails(BaseModel):
 
 class ClaimData(BaseModel):
     """Complete claim information extracted from FNOL"""
+    model_config = ConfigDict(frozen=True, extra='ignore')
+    
     policy_information: PolicyInformation = Field(default_factory=PolicyInformation)
     incident_information: IncidentInformation = Field(default_factory=IncidentInformation)
     involved_parties: InvolvedParties = Field(default_factory=InvolvedParties)
@@ -83,14 +95,38 @@ class ClaimData(BaseModel):
     initial_estimate: Optional[float] = None
 
 
+class ExtractedFields(BaseModel):
+    """Flat field set returned by the AI extractor, validated before use"""
+    model_config = ConfigDict(frozen=True, extra='ignore')
+    
+    policy_number: Optional[str] = None
+    policyholder_name: Optional[str] = None
+    effective_dates: Optional[str] = None
+    date_of_loss: Optional[str] = None
+    time_of_loss: Optional[str] = None
+    location: Optional[str] = None
+    description: Optional[str] = None
+    claimant: Optional[str] = None
+    phone: Optional[str] = None
+    email: Optional[str] = None
+    asset_type: Optional[str] = None
+    vin: Optional[str] = None
+    make: Optional[str] = None
+    model: Optional[str] = None
+    year: Optional[str] = None
+    damage_description: Optional[str] = None
+    estimated_damage: Optional[float] = None
+    claim_type: Optional[str] = None
+    police_report_number: Optional[str] = None
+
+
 class ClaimOutput(BaseModel):
     """Final output format for processed claims"""
+    model_config = ConfigDict(frozen=True, use_enum_values=True)
+    
     claim_id: str
     processed_at: str
     extracted_fields: ClaimData
     missing_fields: List[str]
     recommended_route: RouteType
     reasoning: str
-
-    class Config:
-        use_enum_values = True
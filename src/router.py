@@ -4,67 +4,206 @@ Claim routing module.
 Routes insurance claims based on business rules and extracted data.
 """
 
-from typing import Tuple, List
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Any, Callable, Iterable, Optional, Pattern, Tuple, List
+
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick is optional; keyword scans fall back to regex
+    ahocorasick = None
+
 from .models import ClaimData, RouteType
 from .config import Config
 
 
+def _normalize_keywords(keywords: Iterable[str]) -> Tuple[str, ...]:
+    """Lowercase and deduplicate keywords once, in a stable order"""
+    return tuple(sorted({keyword.lower() for keyword in keywords}))
+
+
+def _build_automaton(keywords: Tuple[str, ...]):
+    """Build an Aho-Corasick automaton over normalized keywords, or None"""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    if len(automaton) == 0:
+        return None
+    automaton.make_automaton()
+    return automaton
+
+
+def _make_scanner(
+    automaton,
+    pattern: Pattern[str],
+    keywords: Tuple[str, ...]
+) -> Callable[[str], List[str]]:
+    """
+    Specialize a keyword scan for the available backend.
+    
+    Picking the automaton or the regex once here keeps that branch, and
+    the method lookups, out of every routing call.
+    
+    Args:
+        automaton: Aho-Corasick automaton over lowercased keywords, or None
+        pattern: Case-insensitive keyword alternation used without automaton
+        keywords: Normalized keywords the scan reports
+        
+    Returns:
+        Function returning every distinct keyword contained in a lowercased
+        text, ordered by first occurrence
+    """
+    if automaton is not None:
+        iter_matches = automaton.iter
+        
+        def scan(text: str) -> List[str]:
+            # Matches arrive by end position; order them by first start like
+            # the regex fallback, so both backends report the same list
+            first_seen = {}
+            for end, keyword in iter_matches(text):
+                if keyword not in first_seen:
+                    first_seen[keyword] = end - len(keyword) + 1
+            return sorted(first_seen, key=lambda keyword: (first_seen[keyword], keyword))
+    else:
+        search = pattern.search
+        
+        def scan(text: str) -> List[str]:
+            # The alternation only detects a hit: its matches cannot overlap,
+            # so "fraud" inside "fraudulent" would be lost. Keywords are
+            # reported by containment, as the automaton reports them.
+            if search(text) is None:
+                return []
+            found = []
+            for keyword in keywords:
+                position = text.find(keyword)
+                if position >= 0:
+                    found.append((position, keyword))
+            found.sort()
+            return [keyword for _, keyword in found]
+    
+    return scan
+
+
+class ReasonCode(IntEnum):
+    """Why a claim was routed where it was; format_reasoning renders it"""
+    MISSING_FIELDS = 0
+    FRAUD_INDICATORS = 1
+    INJURY = 2
+    FAST_TRACK = 3
+    NO_ESTIMATE = 4
+    HIGH_DAMAGE = 5
+
+
+@dataclass(frozen=True)
+class RouteDecision:
+    """
+    Outcome of routing one claim, with the evidence behind it.
+    
+    Keyword matches are None when routing decided before running that
+    check (e.g. no scans are needed for a claim missing mandatory fields).
+    """
+    route: RouteType
+    reasoning: str
+    fraud_matches: Optional[List[str]] = None
+    injury_matches: Optional[List[str]] = None
+    estimated_damage: Optional[float] = None
+
+
+# Keywords lowercased once, so scans never normalize them per call and
+# both backends report matches in the same lowercase form
+_FRAUD_KW_LOWER = _normalize_keywords(Config.FRAUD_KEYWORDS)
+_INJURY_KW_LOWER = _normalize_keywords(Config.INJURY_KEYWORDS)
+
+# Single-pass multi-keyword scanners (None without pyahocorasick)
+_FRAUD_AC = _build_automaton(_FRAUD_KW_LOWER)
+_INJURY_AC = _build_automaton(_INJURY_KW_LOWER)
+
+# Scans specialized for whichever backend is available; without an
+# automaton they use the precompiled alternations to detect a hit
+_SCAN_FRAUD = _make_scanner(_FRAUD_AC, Config.FRAUD_RE, _FRAUD_KW_LOWER)
+_SCAN_INJURY = _make_scanner(_INJURY_AC, Config.INJURY_RE, _INJURY_KW_LOWER)
+
+
 class ClaimRouter:
     """Routes claims to appropriate queues based on business rules"""
     
     def __init__(self):
         """Initialize router with configuration"""
         self.fast_track_threshold = Config.FAST_TRACK_THRESHOLD
-        self.fraud_keywords = Config.FRAUD_KEYWORDS
-        self.injury_keywords = Config.INJURY_KEYWORDS
+        # The threshold is fixed, so its reasoning text is formatted once
+        self._threshold_text = f"${self.fast_track_threshold:,.2f}"
+        
+        # Keyword scans are built once at import from Config's keyword sets
+        # and shared by every router
+        self._scan_fraud = _SCAN_FRAUD
+        self._scan_injury = _SCAN_INJURY
     
-    def check_fraud_indicators(self, claim_data: ClaimData) -> Tuple[bool, List[str]]:
+    def _search_text(self, claim_data: ClaimData) -> str:
         """
-        Check for fraud indicators in claim description.
+        Build the free text scanned for keywords, once per routing decision.
+        
+        The text is lowercased here, once, so scans never normalize it.
         
         Args:
-            claim_data: The claim data to check
+            claim_data: The claim data to scan
             
         Returns:
-            Tuple of (has_fraud_indicators, list of matched keywords)
+            Combined incident and damage descriptions
         """
         description = claim_data.incident_information.description or ""
         damage_desc = claim_data.asset_details.damage_description or ""
         
-        # Combine all text fields to search
-        search_text = f"{description} {damage_desc}".lower()
+        return f"{description} {damage_desc}".lower()
+    
+    def check_fraud_indicators(
+        self,
+        claim_data: ClaimData,
+        search_text: Optional[str] = None
+    ) -> Tuple[bool, List[str]]:
+        """
+        Check for fraud indicators in claim description.
+        
+        Args:
+            claim_data: The claim data to check
+            search_text: Text from _search_text, if already built for this claim
+            
+        Returns:
+            Tuple of (has_fraud_indicators, list of matched keywords)
+        """
+        if search_text is None:
+            search_text = self._search_text(claim_data)
         
-        matched_keywords = []
-        for keyword in self.fraud_keywords:
-            if keyword.lower() in search_text:
-                matched_keywords.append(keyword)
+        matched_keywords = self._scan_fraud(search_text)
         
         return len(matched_keywords) > 0, matched_keywords
     
-    def check_injury_claim(self, claim_data: ClaimData) -> Tuple[bool, List[str]]:
+    def check_injury_claim(
+        self,
+        claim_data: ClaimData,
+        search_text: Optional[str] = None
+    ) -> Tuple[bool, List[str]]:
         """
         Check if claim involves injury.
         
         Args:
             claim_data: The claim data to check
+            search_text: Text from _search_text, if already built for this claim
             
         Returns:
             Tuple of (is_injury_claim, list of matched keywords)
         """
         # Check claim type
-        if claim_data.claim_type and claim_data.claim_type.lower() == "injury":
+        claim_type = claim_data.claim_type
+        if claim_type and claim_type.lower() == "injury":
             return True, ["claim_type: injury"]
         
         # Check description for injury keywords
-        description = claim_data.incident_information.description or ""
-        damage_desc = claim_data.asset_details.damage_description or ""
-        
-        search_text = f"{description} {damage_desc}".lower()
+        if search_text is None:
+            search_text = self._search_text(claim_data)
         
-        matched_keywords = []
-        for keyword in self.injury_keywords:
-            if keyword.lower() in search_text:
-                matched_keywords.append(keyword)
+        matched_keywords = self._scan_injury(search_text)
         
         return len(matched_keywords) > 0, matched_keywords
     
@@ -89,58 +228,184 @@ class ClaimRouter:
         Returns:
             Tuple of (route_type, reasoning)
         """
+        route, reason, args = self.route_claim_fast(claim_data, missing_fields)
+        return route, self.format_reasoning(reason, args)
+    
+    def route_claim_fast(
+        self,
+        claim_data: ClaimData,
+        missing_fields: List[str]
+    ) -> Tuple[RouteType, ReasonCode, Tuple[Any, ...]]:
+        """
+        Route a claim without building the reasoning text.
+        
+        For callers that consume routes programmatically; pass the reason
+        and its arguments to format_reasoning when a person needs to read it.
+        
+        Args:
+            claim_data: The extracted claim data
+            missing_fields: List of missing mandatory fields
+            
+        Returns:
+            Tuple of (route_type, reason_code, reason_args)
+        """
         # Priority 1: Manual Review for missing fields
         if missing_fields:
-            reasoning = (
+            return RouteType.MANUAL_REVIEW, ReasonCode.MISSING_FIELDS, (missing_fields,)
+        
+        # Priority 2: Investigation Flag for fraud indicators
+        search_text = self._search_text(claim_data)
+        has_fraud, fraud_keywords = self.check_fraud_indicators(claim_data, search_text)
+        if has_fraud:
+            return RouteType.INVESTIGATION, ReasonCode.FRAUD_INDICATORS, (fraud_keywords,)
+        
+        # Priority 3: Specialist Queue for injury claims
+        is_injury, injury_indicators = self.check_injury_claim(claim_data, search_text)
+        if is_injury:
+            return RouteType.SPECIALIST_QUEUE, ReasonCode.INJURY, (injury_indicators,)
+        
+        # Priority 4: Fast-track for low-value claims
+        estimated_damage = claim_data.asset_details.estimated_damage
+        if estimated_damage is not None and estimated_damage < self.fast_track_threshold:
+            return RouteType.FAST_TRACK, ReasonCode.FAST_TRACK, (estimated_damage,)
+        
+        # Default: Manual Review for high-value claims or missing estimate
+        if estimated_damage is None:
+            return RouteType.MANUAL_REVIEW, ReasonCode.NO_ESTIMATE, ()
+        return RouteType.MANUAL_REVIEW, ReasonCode.HIGH_DAMAGE, (estimated_damage,)
+    
+    def decide_route(
+        self,
+        claim_data: ClaimData,
+        missing_fields: List[str]
+    ) -> RouteDecision:
+        """
+        Route a claim and keep the keyword checks that decided it.
+        
+        Args:
+            claim_data: The extracted claim data
+            missing_fields: List of missing mandatory fields
+            
+        Returns:
+            RouteDecision with the route, reasoning and any checks already run
+        """
+        route, reason, args = self.route_claim_fast(claim_data, missing_fields)
+        
+        # Checks run in priority order, so the reason tells which ones ran
+        # and came back empty
+        fraud_keywords = injury_indicators = None
+        if reason == ReasonCode.FRAUD_INDICATORS:
+            fraud_keywords = args[0]
+        elif reason == ReasonCode.INJURY:
+            fraud_keywords, injury_indicators = [], args[0]
+        elif reason != ReasonCode.MISSING_FIELDS:
+            fraud_keywords, injury_indicators = [], []
+        
+        return RouteDecision(
+            route,
+            self.format_reasoning(reason, args),
+            fraud_keywords,
+            injury_indicators,
+            claim_data.asset_details.estimated_damage
+        )
+    
+    def format_reasoning(self, reason: ReasonCode, args: Tuple[Any, ...]) -> str:
+        """
+        Explain a routing decision.
+        
+        Args:
+            reason: Reason code from route_claim_fast
+            args: Reason arguments from route_claim_fast
+            
+        Returns:
+            Human-readable reasoning for the route
+        """
+        if reason == ReasonCode.MISSING_FIELDS:
+            missing_fields, = args
+            return (
                 f"Claim requires manual review due to {len(missing_fields)} missing mandatory field(s): "
                 f"{', '.join(missing_fields)}. Complete information is required before processing."
             )
-            return RouteType.MANUAL_REVIEW, reasoning
         
-        # Priority 2: Investigation Flag for fraud indicators
-        has_fraud, fraud_keywords = self.check_fraud_indicators(claim_data)
-        if has_fraud:
-            reasoning = (
+        if reason == ReasonCode.FRAUD_INDICATORS:
+            fraud_keywords, = args
+            return (
                 f"Claim flagged for investigation due to potential fraud indicators. "
                 f"Keywords detected: {', '.join(fraud_keywords)}. "
                 f"Requires detailed review by fraud investigation team."
             )
-            return RouteType.INVESTIGATION, reasoning
         
-        # Priority 3: Specialist Queue for injury claims
-        is_injury, injury_indicators = self.check_injury_claim(claim_data)
-        if is_injury:
-            reasoning = (
+        if reason == ReasonCode.INJURY:
+            injury_indicators, = args
+            return (
                 f"Claim routed to specialist queue due to injury involvement. "
                 f"Indicators: {', '.join(injury_indicators)}. "
                 f"Requires assessment by injury claims specialist."
             )
-            return RouteType.SPECIALIST_QUEUE, reasoning
         
-        # Priority 4: Fast-track for low-value claims
-        estimated_damage = claim_data.asset_details.estimated_damage
-        if estimated_damage is not None and estimated_damage < self.fast_track_threshold:
-            reasoning = (
+        if reason == ReasonCode.FAST_TRACK:
+            estimated_damage, = args
+            return (
                 f"Claim meets fast-track criteria: estimated damage (${estimated_damage:,.2f}) "
-                f"is below ${self.fast_track_threshold:,.2f} threshold and all mandatory fields "
+                f"is below {self._threshold_text} threshold and all mandatory fields "
                 f"are present. No fraud indicators or injury claims detected."
             )
-            return RouteType.FAST_TRACK, reasoning
         
-        # Default: Manual Review for high-value claims or missing estimate
-        if estimated_damage is None:
-            reasoning = (
+        if reason == ReasonCode.NO_ESTIMATE:
+            return (
                 "Claim requires manual review as estimated damage amount is not provided. "
                 "Damage assessment needed before routing decision."
             )
-        else:
-            reasoning = (
-                f"Claim requires manual review due to high estimated damage (${estimated_damage:,.2f}), "
-                f"which exceeds the fast-track threshold of ${self.fast_track_threshold:,.2f}. "
-                f"Requires detailed assessment by claims adjuster."
-            )
         
-        return RouteType.MANUAL_REVIEW, reasoning
+        estimated_damage, = args
+        return (
+            f"Claim requires manual review due to high estimated damage (${estimated_damage:,.2f}), "
+            f"which exceeds the fast-track threshold of {self._threshold_text}. "
+            f"Requires detailed assessment by claims adjuster."
+        )
+    
+    def route_batch(
+        self,
+        claims: List[ClaimData],
+        missing_fields: List[List[str]]
+    ) -> List[Tuple[RouteType, str]]:
+        """
+        Route many claims at once.
+        
+        Args:
+            claims: The extracted claims
+            missing_fields: Missing mandatory fields for each claim, in order
+            
+        Returns:
+            List of (route_type, reasoning), matching route_claim per claim
+        """
+        format_reasoning = self.format_reasoning
+        return [
+            (route, format_reasoning(reason, args))
+            for route, reason, args in self.route_batch_fast(claims, missing_fields)
+        ]
+    
+    def route_batch_fast(
+        self,
+        claims: List[ClaimData],
+        missing_fields: List[List[str]]
+    ) -> List[Tuple[RouteType, ReasonCode, Tuple[Any, ...]]]:
+        """
+        Route many claims at once without building reasoning text.
+        
+        Args:
+            claims: The extracted claims
+            missing_fields: Missing mandatory fields for each claim, in order
+            
+        Returns:
+            List of (route_type, reason_code, reason_args), matching
+            route_claim_fast per claim
+        """
+        route_claim_fast = self.route_claim_fast
+        return [
+            route_claim_fast(claim_data, missing)
+            for claim_data, missing in zip(claims, missing_fields)
+        ]
     
     def get_routing_summary(
         self, 
@@ -157,13 +422,24 @@ class ClaimRouter:
         Returns:
             Dictionary with routing analysis
         """
-        route, reasoning = self.route_claim(claim_data, missing_fields)
-        has_fraud, fraud_keywords = self.check_fraud_indicators(claim_data)
-        is_injury, injury_indicators = self.check_injury_claim(claim_data)
+        decision = self.decide_route(claim_data, missing_fields)
+        
+        # Only run the checks routing stopped short of
+        search_text = None
+        fraud_keywords = decision.fraud_matches
+        if fraud_keywords is None:
+            search_text = self._search_text(claim_data)
+            _, fraud_keywords = self.check_fraud_indicators(claim_data, search_text)
+        injury_indicators = decision.injury_matches
+        if injury_indicators is None:
+            _, injury_indicators = self.check_injury_claim(claim_data, search_text)
+        has_fraud = len(fraud_keywords) > 0
+        is_injury = len(injury_indicators) > 0
+        estimated_damage = decision.estimated_damage
         
         return {
-            'recommended_route': route,
-            'reasoning': reasoning,
+            'recommended_route': decision.route,
+            'reasoning': decision.reasoning,
             'fraud_indicators': {
                 'detected': has_fraud,
                 'keywords': fraud_keywords
@@ -172,12 +448,12 @@ class ClaimRouter:
                 'detected': is_injury,
                 'indicators': injury_indicators
             },
-            'estimated_damage': claim_data.asset_details.estimated_damage,
+            'estimated_damage': estimated_damage,
             'fast_track_eligible': (
                 not missing_fields and 
                 not has_fraud and 
                 not is_injury and
-                claim_data.asset_details.estimated_damage is not None and
-                claim_data.asset_details.estimated_damage < self.fast_track_threshold
+                estimated_damage is not None and
+                estimated_damage < self.fast_track_threshold
             )
         }
@@ -4,6 +4,7 @@ Field validation module for insurance claims.
 Validates extracted data and identifies missing or inconsistent fields.
 """
 
+from operator import attrgetter
 from typing import List, Dict, Any
 from .models import ClaimData
 from .config import Config
@@ -12,9 +13,31 @@ from .config import Config
 class ClaimValidator:
     """Validates claim data and identifies issues"""
     
+    # Getters for each known field, built once; field order sets the
+    # order in which missing fields are reported
+    _FIELD_GETTERS = {
+        'policy_number': attrgetter('policy_information.policy_number'),
+        'policyholder_name': attrgetter('policy_information.policyholder_name'),
+        'date_of_loss': attrgetter('incident_information.date_of_loss'),
+        'location': attrgetter('incident_information.location'),
+        'claim_type': attrgetter('claim_type'),
+        'estimated_damage': attrgetter('asset_details.estimated_damage'),
+        'claimant': attrgetter('involved_parties.claimant'),
+        'description': attrgetter('incident_information.description'),
+    }
+    
     def __init__(self):
         """Initialize the validator with mandatory fields"""
         self.mandatory_fields = Config.MANDATORY_FIELDS
+        
+        # Resolve the mandatory fields to their getters once, so validation
+        # is a plain loop over (name, getter) pairs
+        self._mandatory_getters = tuple(
+            (field, getter) for field, getter in self._FIELD_GETTERS.items()
+            if field in self.mandatory_fields
+        )
+        # Mandatory fields with no known location can never be present
+        self._unlocatable_fields = sorted(set(self.mandatory_fields) - self._FIELD_GETTERS.keys())
     
     def get_field_value(self, claim_data: ClaimData, field_path: str) -> Any:
         """
@@ -27,19 +50,8 @@ class ClaimValidator:
         Returns:
             Field value or None if not found
         """
-        # Map field paths to actual nested locations
-        field_mapping = {
-            'policy_number': claim_data.policy_information.policy_number,
-            'policyholder_name': claim_data.policy_information.policyholder_name,
-            'date_of_loss': claim_data.incident_information.date_of_loss,
-            'location': claim_data.incident_information.location,
-            'claim_type': claim_data.claim_type,
-            'estimated_damage': claim_data.asset_details.estimated_damage,
-            'claimant': claim_data.involved_parties.claimant,
-            'description': claim_data.incident_information.description,
-        }
-        
-        return field_mapping.get(field_path)
+        getter = self._FIELD_GETTERS.get(field_path)
+        return getter(claim_data) if getter is not None else None
     
     def validate_claim(self, claim_data: ClaimData) -> List[str]:
         """
@@ -53,13 +65,15 @@ class ClaimValidator:
         """
         missing_fields = []
         
-        for field in self.mandatory_fields:
-            value = self.get_field_value(claim_data, field)
+        for field, getter in self._mandatory_getters:
+            value = getter(claim_data)
             
             # Check if field is missing or empty
-            if value is None or (isinstance(value, str) and not value.strip()):
+            if value is None or (value.__class__ is str and not value.strip()):
                 missing_fields.append(field)
         
+        missing_fields.extend(self._unlocatable_fields)
+        
         return missing_fields
     
     def check_data_consistency(self, claim_data: ClaimData) -> List[str]:
@@ -73,21 +87,25 @@ class ClaimValidator:
             List of inconsistency warnings
         """
         warnings = []
+        estimated_damage = claim_data.asset_details.estimated_damage
+        initial_estimate = claim_data.initial_estimate
+        claimant = claim_data.involved_parties.claimant
+        policyholder_name = claim_data.policy_information.policyholder_name
         
         # Check if estimated damage matches initial estimate
-        if claim_data.asset_details.estimated_damage and claim_data.initial_estimate:
-            if claim_data.asset_details.estimated_damage != claim_data.initial_estimate:
+        if estimated_damage and initial_estimate:
+            if estimated_damage != initial_estimate:
                 warnings.append("Estimated damage and initial estimate do not match")
         
         # Check if claimant matches policyholder (when they should be the same)
-        if claim_data.involved_parties.claimant and claim_data.policy_information.policyholder_name:
+        if claimant and policyholder_name:
             # This is just a warning, not an error
-            if claim_data.involved_parties.claimant.lower() != claim_data.policy_information.policyholder_name.lower():
+            if claimant.lower() != policyholder_name.lower():
                 warnings.append("Claimant differs from policyholder (may be third-party claim)")
         
         # Check for negative damage amounts
-        if claim_data.asset_details.estimated_damage is not None:
-            if claim_data.asset_details.estimated_damage < 0:
+        if estimated_damage is not None:
+            if estimated_damage < 0:
                 warnings.append("Estimated damage is negative")
         
         return warnings
@@ -2,12 +2,29 @@
 Unit tests for the PDF extractor module.
 """
 
+import asyncio
 import pytest
+import src.extractor as extractor_module
 from pathlib import Path
+from types import SimpleNamespace
 from src.extractor import PDFExtractor
+from src.config import Config
 from src.models import ClaimData
 
 
+def make_async_client(content):
+    """Build a stub AsyncOpenAI client whose completions return content"""
+    response = SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=content))]
+    )
+    
+    async def create(**kwargs):
+        await asyncio.sleep(0)
+        return response
+    
+    return SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+
+
 class TestPDFExtractor:
     """Test cases for PDFExtractor"""
     
@@ -21,12 +38,48 @@ class TestPDFExtractor:
         assert extractor is not None
         assert extractor.use_ai == False
     
+    def test_ai_extractors_share_client(self, monkeypatch):
+        """Test AI mode builds one shared OpenAI client from the API key"""
+        monkeypatch.setattr(Config, "OPENAI_API_KEY", "sk-dummy")
+        monkeypatch.setattr(PDFExtractor, "_client_singleton", None)
+        monkeypatch.setattr(PDFExtractor, "_async_client_singleton", None)
+        
+        first = PDFExtractor(use_ai=True)
+        second = PDFExtractor(use_ai=True)
+        
+        assert first.use_ai == True
+        assert first.client is second.client
+        assert PDFExtractor._get_async_client() is PDFExtractor._get_async_client()
+    
     def test_extract_text_from_pdf(self, extractor):
         """Test text extraction from PDF"""
         # This test requires actual PDF files
         # Will work after PDFs are generated
         pass
     
+    def test_extract_text_from_sample_pdf(self, extractor):
+        """Test text extraction from a sample FNOL PDF"""
+        pdf_path = Path(__file__).parent / "sample_fnol" / "fast_track_claim.pdf"
+        
+        text = extractor.extract_text_from_pdf(str(pdf_path))
+        result = extractor.extract_with_regex(text)
+        
+        assert result['policy_number'] == 'POL-2026-FT-001'
+        assert result['estimated_damage'] == 12500.0
+    
+    def test_short_fast_path_text_falls_back_to_pdfplumber(self, extractor, monkeypatch):
+        """Test too little PDFium text makes extraction fall back to pdfplumber"""
+        calls = []
+        monkeypatch.setattr(extractor_module, "pdfium", object())
+        monkeypatch.setattr(extractor, "_extract_text_fast", lambda data: calls.append(data) or "POLICY")
+        pdf_path = Path(__file__).parent / "sample_fnol" / "fast_track_claim.pdf"
+        
+        text = extractor.extract_text_from_pdf(str(pdf_path))
+        
+        assert len(calls) == 1
+        assert len(text.split()) >= extractor_module._MIN_FAST_PATH_WORDS
+        assert extractor.extract_with_regex(text)['policy_number'] == 'POL-2026-FT-001'
+    
     def test_extract_with_regex(self, extractor):
         """Test regex-based extraction"""
         sample_text = """
@@ -43,6 +96,66 @@ class TestPDFExtractor:
         assert 'estimated_damage' in result
         assert result['estimated_damage'] == 12500.0
     
+    def test_extract_with_ai_parses_structured_output(self, extractor):
+        """Test that structured AI output is validated and nulls dropped"""
+        content = '{"policy_number": "POL-123456", "estimated_damage": 12500, "vin": null}'
+        response = SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content))]
+        )
+        extractor.client = SimpleNamespace(
+            chat=SimpleNamespace(
+                completions=SimpleNamespace(create=lambda **kwargs: response)
+            )
+        )
+        
+        result = extractor.extract_with_ai("POLICY NUMBER: POL-123456")
+        
+        assert result == {'policy_number': 'POL-123456', 'estimated_damage': 12500.0}
+    
+    def test_extract_with_ai_async_parses_structured_output(self, extractor, monkeypatch):
+        """Test the async AI path validates structured output like the sync one"""
+        content = '{"policy_number": "POL-123456", "estimated_damage": 12500, "vin": null}'
+        monkeypatch.setattr(PDFExtractor, "_async_client_singleton", make_async_client(content))
+        
+        result = asyncio.run(extractor.extract_with_ai_async("POLICY NUMBER: POL-123456"))
+        
+        assert result == {'policy_number': 'POL-123456', 'estimated_damage': 12500.0}
+    
+    def test_extract_with_ai_async_returns_empty_on_error(self, extractor, monkeypatch):
+        """Test the async AI path falls back to no fields on unparsable output"""
+        monkeypatch.setattr(PDFExtractor, "_async_client_singleton", make_async_client("not json"))
+        
+        assert asyncio.run(extractor.extract_with_ai_async("text")) == {}
+    
+    def test_extract_from_pdf_async(self, extractor, monkeypatch):
+        """Test async PDF extraction merges AI fields with the regex supplement"""
+        content = '{"policyholder_name": "John Smith", "claim_type": "auto"}'
+        monkeypatch.setattr(PDFExtractor, "_async_client_singleton", make_async_client(content))
+        extractor.use_ai = True
+        pdf_path = Path(__file__).parent / "sample_fnol" / "fast_track_claim.pdf"
+        
+        claim_data = asyncio.run(extractor.extract_from_pdf_async(str(pdf_path)))
+        
+        assert claim_data.policy_information.policyholder_name == 'John Smith'
+        assert claim_data.policy_information.policy_number == 'POL-2026-FT-001'
+        assert claim_data.asset_details.estimated_damage == 12500.0
+    
+    def test_regex_supplement_skipped_when_ai_complete(self, extractor, monkeypatch):
+        """Test that regex is not re-run when AI supplied every regex field"""
+        extractor.use_ai = True
+        monkeypatch.setattr(extractor, 'extract_with_regex', pytest.fail)
+        extracted = {
+            'policy_number': 'POL-123456',
+            'date_of_loss': '2026-02-01',
+            'vin': '1HGBH41JXMN109186',
+            'estimated_damage': 12500.0
+        }
+        
+        claim_data = extractor._build_claim_data("", extracted)
+        
+        assert claim_data.policy_information.policy_number == 'POL-123456'
+        assert claim_data.asset_details.asset_id == '1HGBH41JXMN109186'
+    
     def test_extract_from_pdf_returns_claim_data(self, extractor):
         """Test that extraction returns ClaimData object"""
         # This test requires actual PDF files
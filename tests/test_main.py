@@ -0,0 +1,110 @@
+"""
+Unit tests for the claims agent and batch processing.
+"""
+
+import asyncio
+import json
+import shutil
+import sys
+import pytest
+from pathlib import Path
+from src.main import ClaimsAgent, _process_batch_async, main
+from src.extractor import PDFExtractor
+from tests.test_extractor import make_async_client
+
+
+SAMPLE_DIR = Path(__file__).parent / "sample_fnol"
+
+
+class TestClaimsAgent:
+    """Test cases for ClaimsAgent"""
+    
+    @pytest.fixture
+    def agent(self):
+        """Create agent instance without AI"""
+        return ClaimsAgent(use_ai=False)
+    
+    def test_process_claim_async(self, agent, tmp_path, monkeypatch, capsys):
+        """Test async processing saves output and reports progress through log"""
+        content = '{"policyholder_name": "John Smith", "claim_type": "auto"}'
+        monkeypatch.setattr(PDFExtractor, "_async_client_singleton", make_async_client(content))
+        agent.extractor.use_ai = True
+        output_path = tmp_path / "fast_track_claim_output.json"
+        lines = []
+        
+        claim_output = asyncio.run(agent.process_claim_async(
+            str(SAMPLE_DIR / "fast_track_claim.pdf"), str(output_path), log=lines.append
+        ))
+        
+        saved = json.loads(output_path.read_text(encoding='utf-8'))
+        assert saved['claim_id'] == claim_output.claim_id
+        assert saved['extracted_fields']['policy_information']['policyholder_name'] == 'John Smith'
+        assert "Processing claim: fast_track_claim.pdf" in lines
+        assert capsys.readouterr().out == ""
+    
+    def test_batch_async_caps_concurrency_and_groups_output(self, agent, monkeypatch, capsys):
+        """Test the async batch limits in-flight claims and prints one block per claim"""
+        in_flight = []
+        peak = []
+        
+        async def fake_process(pdf_path, output_path, log=print):
+            in_flight.append(pdf_path)
+            peak.append(len(in_flight))
+            log(f"start {pdf_path}")
+            await asyncio.sleep(0.01)
+            log(f"end {pdf_path}")
+            in_flight.remove(pdf_path)
+            if pdf_path.endswith("bad.pdf"):
+                raise ValueError("unreadable")
+        
+        monkeypatch.setattr(agent, "process_claim_async", fake_process)
+        names = ["a.pdf", "b.pdf", "bad.pdf", "c.pdf", "d.pdf"]
+        jobs = [(Path(name), Path(f"{name}.json")) for name in names]
+        
+        asyncio.run(_process_batch_async(agent, jobs, max_concurrency=2))
+        
+        out = capsys.readouterr().out.splitlines()
+        assert max(peak) == 2
+        assert "Error processing bad.pdf: unreadable" in out
+        for name in names:
+            start = out.index(f"start {name}")
+            assert out[start + 1] == f"end {name}"
+    
+    def test_input_dir_with_worker_processes(self, tmp_path, monkeypatch, capsys):
+        """Test regex batch runs in worker processes print one block per claim"""
+        input_dir = tmp_path / "input"
+        input_dir.mkdir()
+        names = ["fast_track_claim.pdf", "injury_claim.pdf"]
+        for name in names:
+            shutil.copy(SAMPLE_DIR / name, input_dir / name)
+        (input_dir / "broken.pdf").write_bytes(b"not a pdf")
+        output_dir = tmp_path / "output"
+        monkeypatch.setattr(sys, "argv", [
+            "main", "--no-ai", "--input-dir", str(input_dir),
+            "--output-dir", str(output_dir), "--workers", "2"
+        ])
+        
+        main()
+        
+        out = capsys.readouterr().out.splitlines()
+        assert sorted(path.name for path in output_dir.iterdir()) == [
+            "fast_track_claim_output.json", "injury_claim_output.json"
+        ]
+        assert any(line.startswith("Error processing broken.pdf:") for line in out)
+        for name in names:
+            header = out.index(f"Processing claim: {name}")
+            assert out[header + 3] == "Step 1: Extracting data from PDF..."
+            assert out[header + 4] == "✓ Extraction complete"
+    
+    @pytest.mark.parametrize("workers", ["0", "-1"])
+    def test_workers_must_be_positive(self, tmp_path, monkeypatch, capsys, workers):
+        """Test --workers below 1 is rejected with a usage error"""
+        monkeypatch.setattr(sys, "argv", [
+            "main", "--no-ai", "--input-dir", str(tmp_path), "--workers", workers
+        ])
+        
+        with pytest.raises(SystemExit) as exc_info:
+            main()
+        
+        assert exc_info.value.code == 2
+        assert "--workers must be at least 1" in capsys.readouterr().err
@@ -3,7 +3,10 @@ Unit tests for the claim router module.
 """
 
 import pytest
-from src.router import ClaimRouter
+import src.router as router_module
+from src.router import ClaimRouter, ReasonCode
+from src.validator import ClaimValidator
+from src.config import Config
 from src.models import (
     ClaimData, PolicyInformation, IncidentInformation,
     InvolvedParties, AssetDetails, RouteType
@@ -120,6 +123,18 @@ class TestClaimRouter:
         assert route == RouteType.SPECIALIST_QUEUE
         assert "injury" in reasoning.lower() or "specialist" in reasoning.lower()
     
+    def test_route_validated_incomplete_claim(self, router):
+        """Test routing an incomplete claim with the validator's missing fields"""
+        claim = ClaimData(
+            policy_information=PolicyInformation(policyholder_name="Jane Smith")
+        )
+        missing_fields = ClaimValidator().validate_claim(claim)
+        route, reasoning = router.route_claim(claim, missing_fields)
+        
+        assert 'policy_number' in missing_fields
+        assert route == RouteType.MANUAL_REVIEW
+        assert "missing" in reasoning.lower()
+    
     def test_check_fraud_indicators(self, router, fraud_claim):
         """Test fraud indicator detection"""
         has_fraud, keywords = router.check_fraud_indicators(fraud_claim)
@@ -158,3 +173,100 @@ class TestClaimRouter:
         
         assert route == RouteType.MANUAL_REVIEW
         assert "$50,000" in reasoning
+    
+    def test_fraud_keywords_case_insensitive_and_deduplicated(self, router):
+        """Test keyword scan ignores case and reports each keyword once"""
+        claim = ClaimData(
+            incident_information=IncidentInformation(
+                description="STAGED accident. Staged again, Inconsistent story."
+            )
+        )
+        has_fraud, keywords = router.check_fraud_indicators(claim)
+        
+        assert has_fraud == True
+        assert keywords == ["staged", "inconsistent"]
+    
+    def test_regex_scan_reports_overlapping_keywords(self):
+        """Test the regex fallback reports keywords contained in longer ones"""
+        scan_fraud = router_module._make_scanner(None, Config.FRAUD_RE, router_module._FRAUD_KW_LOWER)
+        scan_injury = router_module._make_scanner(None, Config.INJURY_RE, router_module._INJURY_KW_LOWER)
+        
+        assert scan_fraud("staged and fraudulent") == ["staged", "fraud", "fraudulent"]
+        assert scan_injury("bodily injury") == ["bodily injury", "injury"]
+        assert scan_fraud("minor fender bender") == []
+    
+    def test_regex_fallback_matches_automaton(self, router, fraud_claim, injury_claim, monkeypatch):
+        """Test the regex fallback reports exactly what the automaton reports"""
+        overlap_claim = ClaimData(
+            incident_information=IncidentInformation(
+                description="Staged and fraudulent. Personal injury and bodily injury reported."
+            )
+        )
+        claims = [fraud_claim, injury_claim, overlap_claim]
+        expected = [
+            (router.check_fraud_indicators(claim), router.check_injury_claim(claim))
+            for claim in claims
+        ]
+        
+        # Rebuild the import-time keyword backends as if pyahocorasick were missing
+        monkeypatch.setattr(router_module, "ahocorasick", None)
+        fraud_ac = router_module._build_automaton(router_module._FRAUD_KW_LOWER)
+        injury_ac = router_module._build_automaton(router_module._INJURY_KW_LOWER)
+        monkeypatch.setattr(router_module, "_SCAN_FRAUD",
+                            router_module._make_scanner(fraud_ac, Config.FRAUD_RE,
+                                                        router_module._FRAUD_KW_LOWER))
+        monkeypatch.setattr(router_module, "_SCAN_INJURY",
+                            router_module._make_scanner(injury_ac, Config.INJURY_RE,
+                                                        router_module._INJURY_KW_LOWER))
+        fallback_router = ClaimRouter()
+        
+        assert fraud_ac is None and injury_ac is None
+        assert [
+            (fallback_router.check_fraud_indicators(claim), fallback_router.check_injury_claim(claim))
+            for claim in claims
+        ] == expected
+        assert expected[2][0] == (True, ["staged", "fraud", "fraudulent"])
+    
+    def test_routing_summary_reuses_routing_checks(self, router, fast_track_claim, monkeypatch):
+        """Test the summary scans each keyword set once per claim"""
+        calls = []
+        scan_fraud = router._scan_fraud
+        monkeypatch.setattr(router, "_scan_fraud", lambda text: calls.append(text) or scan_fraud(text))
+        summary = router.get_routing_summary(fast_track_claim, [])
+        
+        assert len(calls) == 1
+        assert summary['recommended_route'] == RouteType.FAST_TRACK
+        assert summary['fast_track_eligible'] == True
+    
+    def test_routing_summary_with_missing_fields(self, router, fraud_claim):
+        """Test the summary still reports indicators routing did not check"""
+        summary = router.get_routing_summary(fraud_claim, ["location"])
+        
+        assert summary['recommended_route'] == RouteType.MANUAL_REVIEW
+        assert summary['fraud_indicators']['detected'] == True
+        assert summary['fast_track_eligible'] == False
+    
+    def test_route_batch_matches_route_claim(self, router, fast_track_claim, fraud_claim,
+                                             injury_claim):
+        """Test batch routing gives the same result as routing each claim"""
+        high_value_claim = ClaimData(
+            asset_details=AssetDetails(estimated_damage=50000.0)
+        )
+        no_estimate_claim = ClaimData()
+        claims = [fast_track_claim, fraud_claim, injury_claim, high_value_claim,
+                  no_estimate_claim, fast_track_claim]
+        missing = [[], [], [], [], [], ["location"]]
+        
+        expected = [router.route_claim(claim, fields) for claim, fields in zip(claims, missing)]
+        
+        assert router.route_batch(claims, missing) == expected
+        assert router.route_batch([], []) == []
+    
+    def test_route_claim_fast_defers_reasoning(self, router, fraud_claim):
+        """Test the fast path returns a reason code that formats to route_claim's text"""
+        route, reason, args = router.route_claim_fast(fraud_claim, [])
+        
+        assert route == RouteType.INVESTIGATION
+        assert reason == ReasonCode.FRAUD_INDICATORS
+        assert router.format_reasoning(reason, args) == router.route_claim(fraud_claim, [])[1]
+        assert router.route_batch_fast([fraud_claim], [[]]) == [(route, reason, args)]
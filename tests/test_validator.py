@@ -69,6 +69,15 @@ class TestClaimValidator:
         assert 'policy_number' in missing_fields
         assert 'estimated_damage' in missing_fields
     
+    def test_missing_fields_in_stable_order(self, validator):
+        """Test that missing fields are reported in field-table order"""
+        missing_fields = validator.validate_claim(ClaimData())
+        
+        assert missing_fields == [
+            'policy_number', 'policyholder_name', 'date_of_loss', 'location',
+            'claim_type', 'estimated_damage', 'claimant'
+        ]
+    
     def test_get_validation_summary(self, validator, complete_claim):
         """Test validation summary generation"""
         summary = validator.get_validation_summary(complete_claim)